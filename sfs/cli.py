@@ -56,10 +56,10 @@ def cli_manager(command=None, exit_on_error=True, raise_error=False):
         # Do anything with the processed arguments
         yield args
     except exceptions.CLIValidationException as exc:
-        log.cli_output("{} {}".format(error_messages['VALIDATION'], str(exc)))
+        log.cli_output("{} {}".format(error_messages['VALIDATION'], exc))
         error = True
     except exceptions.SFSException as exc:
-        log.cli_output('{} {}'.format(error_messages['INTERNAL'], str(exc)))
+        log.cli_output('{} {}'.format(error_messages['INTERNAL'], exc))
         log.logger.exception("Internal Error")
         error = True
     except Exception:
@@ -67,6 +67,8 @@ def cli_manager(command=None, exit_on_error=True, raise_error=False):
         log.logger.exception("Unknown Error")
         error = True
     finally:
+        # Write out buffered CLI output before the process exits
+        log.cli_handler.flush()
         if error and raise_error:
             raise
         if exit_on_error:
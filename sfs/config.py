@@ -14,6 +14,7 @@ LOG_FILE_NUM_BACKUPS = 10
 
 # CLI
 CLI_OUTPUT_PREFIX = '>> '
+CLI_BUFFER_CAPACITY = 1024
 
 # Tests
 TEST_DIR = os.path.join(SFS_ROOT_DIR, 'tests')
@@ -40,6 +40,8 @@ class SFS:
     def __init__(self, root):
         self.root = root
         self.collections = {}
+        self.collections_dir = SFS.get_collections_dir(root)
+        self._collections_by_base = None
 
     @staticmethod
     def init_sfs(path):
@@ -90,6 +92,7 @@ class SFS:
         save_dict = fs.load_unpickled(SFS.get_sfs_dir(self.root), constants['SFS_META_FILE'])
         if type(save_dict) is dict and 'collections' in save_dict:
             self.collections = save_dict['collections']
+            self._collections_by_base = None
         else:
             log.logger.warn('Invalid metadata for SFS with root at "%s"', self.root)
 
@@ -107,11 +110,12 @@ class SFS:
         - Adds links to to all files in the directory
         :return: A named tuple of type SfsUpdates indicating the number of files added
         """
-        col_dir = os.path.join(SFS.get_collections_dir(self.root), name)
+        col_dir = os.path.join(self.collections_dir, name)
         col = Collection(name, base, self.root, col_dir)
         os.makedirs(col_dir)
 
         self.collections[name] = col.get_save_dict()
+        self._collections_by_base = None
         self._save()
 
         return col.add_or_update()
@@ -125,7 +129,7 @@ class SFS:
         return Collection.form_save_dict(
             self.collections[name],
             self.root,
-            os.path.join(SFS.get_collections_dir(self.root), name)
+            os.path.join(self.collections_dir, name)
         ) if name in self.collections else None
 
     def get_collection_by_path(self, path):
@@ -135,17 +139,28 @@ class SFS:
         :return: Instance of Collection if found else None
         """
         path = fs.expand_path(path)
-        cols = self.get_all_collections()
+        cols_by_base = self._get_collections_by_base()
         while path != '/':
-            for col in cols.values():
-                if path == col.base:
-                    return col
+            if path in cols_by_base:
+                return cols_by_base[path]
             path = os.path.dirname(path)
         return None
 
+    def _get_collections_by_base(self):
+        """
+        Return all collections as a map of Collection base to the corresponding Collection instance
+        The map is built once and reused until collections are added or deleted
+        """
+        if self._collections_by_base is None:
+            self._collections_by_base = {col.base: col for col in self.get_all_collections().values()}
+        return self._collections_by_base
+
     def get_all_collections(self):
         """Return all collections as a map of Collection Name to the corresponding Collection instance"""
-        return {name: self.get_collection_by_name(name) for name in self.collections.keys()}
+        return {
+            name: Collection.form_save_dict(col_dict, self.root, os.path.join(self.collections_dir, name))
+            for name, col_dict in self.collections.items()
+        }
 
     def del_collection(self, name):
         """
@@ -156,6 +171,7 @@ class SFS:
         """
         col = self.get_collection_by_name(name)
         self.collections.pop(name)
+        self._collections_by_base = None
         shutil.rmtree(col.col_dir)
         self._save()
 
@@ -178,7 +194,11 @@ class SFS:
             """Return True for foreign or orphan links within the psecified collection root given the source path"""
             return fs.is_parent_dir(path, col_root) and _del_cond_all(path)
 
-        _del_cond = _del_cond_all if col_root is None else _del_cond_by_root
+        if col_root is None:
+            _del_cond = _del_cond_all
+        else:
+            col_root = fs.expand_path(col_root)
+            _del_cond = _del_cond_by_root
 
         deleted = 0
         for root, dirs, files, links in SFS.walk(fs.walk_dfs, self.root):
@@ -206,8 +226,8 @@ class SFS:
             constants['SFS_FILE_EXTENSION']
         }
         for root, files, dirs, links in walk_gen(start_dir):
-            dirs[:] = list(filter(lambda n: n.path not in _filter_dirs, dirs))
-            files[:] = list(filter(lambda n: os.path.splitext(n.name)[1] not in _filter_extensions, files))
+            dirs[:] = [n for n in dirs if n.path not in _filter_dirs]
+            files[:] = [n for n in files if os.path.splitext(n.name)[1] not in _filter_extensions]
             yield root, files, dirs, links
 
 
@@ -244,7 +264,8 @@ class Collection:
         """
         Adds or updates collection metadata and adds links to new collection files
         :param curr_stats: A set of all paths to files that were previously added to the collection. Any path not in
-        this set is treated as a new collection file. If None, all files are treated as new
+        this set is treated as a new collection file. If None, all files are treated as new. Otherwise, stale metadata
+        is deleted and metadata of existing files is rewritten only if it has changed
         :return: A named tuple of type SfsUpdates indicating the number of files added or updated
         """
         added = updated = 0
@@ -255,40 +276,70 @@ class Collection:
             root_rel = os.path.relpath(root, self.base)
             stats_root = os.path.abspath(os.path.join(self.stats_base, root_rel))
             sfs_root = os.path.abspath(os.path.join(sfs_base, root_rel))
+            if curr_stats is not None:
+                self._del_stale_stats(stats_root, files, dirs, links)
             os.makedirs(stats_root, exist_ok=True)
+            sfs_root_exists = False
 
             for node in itertools.chain(files, links):
                 col_file = node.path
+                stats_file = os.path.join(stats_root, node.name)
                 if curr_stats is None or col_file not in curr_stats:
                     # Create links for new collection files that are not in curr_stats
                     added += 1
-                    os.makedirs(sfs_root, exist_ok=True)
+                    if not sfs_root_exists:
+                        # SFS directory is created only once per directory and only if it has new files
+                        os.makedirs(sfs_root, exist_ok=True)
+                        sfs_root_exists = True
                     sfs_file = os.path.join(sfs_root, node.name)
                     fs.create_symlink(col_file, sfs_file)
                 else:
                     updated += 1
+                    # Skip rewriting metadata that has not changed
+                    try:
+                        unchanged = fs.load_unpickled(stats_file) == node.stat
+                    except Exception:
+                        # Unreadable metadata, for example one left empty by an interrupted write, is rewritten
+                        unchanged = False
+                    if unchanged:
+                        continue
 
                 # Save metadata
-                stats_file = os.path.join(stats_root, node.name)
                 fs.save_pickled(node.stat, stats_file)
 
         return SfsUpdates(added=added, deleted=0, updated=updated)
 
+    @staticmethod
+    def _del_stale_stats(stats_root, files, dirs, links):
+        """
+        Delete metadata in a metadata directory that does not correspond to the contents of its source directory
+        Metadata of files and links is retained only for files and links, and that of directories only for directories
+        """
+        if not os.path.isdir(stats_root):
+            return
+        node_names = {node.name for node in itertools.chain(files, links)}
+        dir_names = {node.name for node in dirs}
+        stats_files, stats_dirs, stats_links = fs.separate_nodes(fs.scan_dir(stats_root))
+        for node in stats_dirs:
+            if node.name not in dir_names:
+                shutil.rmtree(node.path)
+        for node in itertools.chain(stats_files, stats_links):
+            if node.name not in node_names:
+                os.unlink(node.path)
+
     def update(self):
         """
         Updates the metadata of an existing collection specified by the given Collection Name
         - Adds, deletes and updates collection metadata to synchronize with actual source directory
+        - Metadata is updated in place, so only the metadata of changed files is rewritten
         - For new files in collections (ones without pre-existing metadata) links are alos added to the SFS
         :return: A named tuple of type SfsUpdates indicating the number of files added and updated
         """
         # Create a set of all existing source files in the collection
-        curr_stats = set(
-            [os.path.join(self.base, os.path.relpath(f.path, self.stats_base))
-             for root, files, dirs, links in fs.walk_bfs(self.stats_base) for f in files]
-        )
-
-        # Delete all collections metadata
-        shutil.rmtree(self.stats_base)
+        curr_stats = {
+            os.path.join(self.base, os.path.relpath(f.path, self.stats_base))
+            for root, files, dirs, links in fs.walk_bfs(self.stats_base) for f in files
+        }
 
         # Update metadata and links
         sfs_updates = self.add_or_update(curr_stats=curr_stats)
@@ -302,4 +353,8 @@ class Collection:
         """
         rel_path = os.path.relpath(col_path, self.base)
         meta_path = os.path.join(self.stats_base, rel_path)
-        return fs.load_unpickled(meta_path) if os.path.isfile(meta_path) else None
+        # Missing metadata is treated as None
+        try:
+            return fs.load_unpickled(meta_path)
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+            return None
@@ -40,13 +40,34 @@ class FSNode:
     """
 
     class NodeStats:
-        """Persisted metadata of a node"""
+        """
+        Persisted metadata of a node
+        Attributes are stored in slots and pickled as constructor arguments. Older metadata, pickled as a dictionary of
+        attributes, is restored with '__setstate__'
+        """
+
+        __slots__ = ('ctime', 'size', 'dest')
 
         def __init__(self, ctime=None, size=0, dest=None):
             self.ctime = ctime
             self.size = size
             self.dest = dest
 
+        def __reduce__(self):
+            return FSNode.NodeStats, (self.ctime, self.size, self.dest)
+
+        def __setstate__(self, state):
+            for attr, value in state.items():
+                setattr(self, attr, value)
+
+        def __eq__(self, other):
+            if not isinstance(other, FSNode.NodeStats):
+                return NotImplemented
+            return (self.ctime, self.size, self.dest) == (other.ctime, other.size, other.dest)
+
+        def __hash__(self):
+            return hash((self.ctime, self.size, self.dest))
+
         def __repr__(self):
             return "{}.{}(ctime={}, size={}, dest={})".format(
                 FSNode.__name__,
@@ -92,7 +113,7 @@ class FSNode:
 
 def scan_dir(path):
     """Scan a directory with 'os.scandir' converting the iterator of DirEntry to FSNode"""
-    return map(lambda dir_entry: FSNode(dir_entry), os.scandir(path))
+    return map(FSNode, os.scandir(path))
 
 
 def separate_nodes(nodes):
@@ -128,7 +149,7 @@ def walk_bfs(dir_path):
         nodes = scan_dir(curr_dir)
         separated = separate_nodes(nodes)
         yield (curr_dir, *separated)
-        pending.extend(map(lambda n: n.path, separated.dirs))
+        pending.extend(n.path for n in separated.dirs)
 
 
 def walk_dfs(dir_path, mode='pre-order'):
@@ -201,13 +222,8 @@ def is_parent_dir(child_path, parent_path):
     """Check whether a directory is a parent of another (Returns True if both are same)"""
     child_path = expand_path(child_path)
     parent_path = expand_path(parent_path)
-    while True:
-        if child_path == parent_path:
-            return True
-        next_child = os.path.dirname(child_path)
-        if child_path == next_child:
-            return False
-        child_path = next_child
+    # Joining with an empty component appends a trailing separator (unless already present, as for the root)
+    return child_path == parent_path or child_path.startswith(os.path.join(parent_path, ''))
 
 
 def count_nodes(dir_path):
@@ -224,17 +240,23 @@ def count_nodes(dir_path):
 
 
 def save_pickled(data, *path):
-    """Save an object to a path or path components specified by 'path'"""
+    """
+    Save an object to a path or path components specified by 'path' using the highest available pickle protocol
+    The object is pickled in memory and written to the file with a single write
+    """
     final_path = os.path.join(*path)
     with open(final_path, 'wb') as mfile:
-        pickle.dump(data, mfile)
+        mfile.write(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
 
 
 def load_unpickled(*path):
-    """Load an object from a path or path components specified by 'path'"""
+    """
+    Load an object from a path or path components specified by 'path'
+    The file is read whole and un-pickled from memory
+    """
     final_path = os.path.join(*path)
     with open(final_path, 'rb') as mfile:
-        data = pickle.load(mfile)
+        data = pickle.loads(mfile.read())
     return data
 
 
@@ -243,8 +265,10 @@ def load_unpickled(*path):
 
 def save_json(data, path, serializer=None):
     """Save an object to a JSON file, optionally with a custom serializer"""
+    # Encoding to a string and writing it once avoids a write call for every chunk emitted by the encoder
+    encoded = json.dumps(data, default=serializer, indent=4)
     with open(path, 'w') as jf:
-        json.dump(data, jf, default=serializer, indent=4)
+        jf.write(encoded)
 
 
 def load_json(path, deserializer=None):
@@ -49,7 +49,7 @@ def frozen(cls):
             self._frozen = True
 
         def __setattr__(self, key, value):
-            if hasattr(self, '_frozen') and self._frozen is True:
+            if getattr(self, '_frozen', False) is True:
                 raise Disallowed('Cannot update frozen object of class "{}"'.format(type(self).__name__))
             cls.__setattr__(self, key, value)
 
@@ -102,14 +102,10 @@ def with_default(val_or_func, default):
 
 def get_readable_size(size_bytes):
     """Convert size in bytes to human readable string"""
-    temp = size_bytes
     units = ['Bytes', 'kB', 'MB', 'GB']
-    for x in range(len(units)):
-        if temp >= 1024 and x < (len(units) - 1):
-            temp = float(temp) / 1024
-            continue
-        break
-    return '%.2f %s' % (temp, units[x])
+    # Each unit spans 10 bits, so the unit index follows from the bit length of the size
+    x = min(max((int(size_bytes).bit_length() - 1) // 10, 0), len(units) - 1)
+    return '%.2f %s' % (size_bytes / (1 << (10 * x)), units[x])
 
 
 # Unused
@@ -22,8 +22,58 @@ def cli_output(message):
     cli_logger.info(message)
 
 
-# Create log directory if it does not exist
-os.makedirs(_get_log_dir(), exist_ok=True)
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    Stream handler that collects formatted records and writes them to the stream in a single call
+    Records are written out when 'capacity' records are buffered, when a record of severity 'flush_level' or above is
+    emitted and when the handler is flushed, which also happens at interpreter shutdown
+    """
+
+    def __init__(self, stream=None, capacity=1024, flush_level=logging.ERROR):
+        super().__init__(stream)
+        self.capacity = capacity
+        self.flush_level = flush_level
+        self.buffer = []
+        self.last_record = None
+
+    def emit(self, record):
+        try:
+            self.buffer.append(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+            return
+        self.last_record = record
+        if len(self.buffer) >= self.capacity or record.levelno >= self.flush_level:
+            self.flush()
+
+    def flush(self):
+        """
+        Write out buffered records to the stream, flushing the stream only if records were written
+        Write errors are reported against the last buffered record with 'handleError', like 'StreamHandler.emit', and
+        the buffered records are discarded
+        """
+        self.acquire()
+        try:
+            record, buffered, self.buffer = self.last_record, self.buffer, []
+            if buffered and self.stream:
+                self.stream.write(''.join(buffered))
+                super().flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+        finally:
+            self.release()
+
+
+# Log directory is resolved once and is not re-read from the environment after import
+log_dir = _get_log_dir()
+
+# Create log directory if it does not exist (a single stat in the common case where it already does)
+if not os.path.isdir(log_dir):
+    os.makedirs(log_dir, exist_ok=True)
 
 # File Handler
 
@@ -31,7 +81,7 @@ _file_formatter = logging.Formatter(
     "%(asctime)s [%(levelname)s] || %(module)s :: %(funcName)s :: %(lineno)s || %(message)s"
 )
 file_handler = logging.handlers.RotatingFileHandler(
-    os.path.join(_get_log_dir(), config.LOG_FILE_NAME),
+    os.path.join(log_dir, config.LOG_FILE_NAME),
     mode='a',
     maxBytes=config.LOG_FILE_MAX_SIZE,
     backupCount=config.LOG_FILE_NUM_BACKUPS
@@ -42,7 +92,7 @@ file_handler.setLevel(config.LOG_LEVEL_FILE)
 # CLI Handler
 
 _cli_formatter = logging.Formatter("{}%(message)s".format(config.CLI_OUTPUT_PREFIX))
-cli_handler = logging.StreamHandler(stream=sys.stdout)
+cli_handler = BufferedStreamHandler(stream=sys.stdout, capacity=config.CLI_BUFFER_CAPACITY)
 cli_handler.setFormatter(_cli_formatter)
 
 # File logger
@@ -1,5 +1,6 @@
 """CLI for collection related operations and queries"""
 
+import operator
 import os
 
 import sfs.core as core
@@ -205,12 +206,12 @@ def _list_cols(args):
     if sfs is None:
         raise exceptions.CLIValidationException(messages['LIST_COLS']['ERROR']['NOT_IN_SFS'])
     log.logger.debug('SFS Root: "%s"', sfs.root)
-    cols = sfs.get_all_collections()
-    if len(cols) <= 0:
+    cols = sorted(sfs.get_all_collections().values(), key=operator.attrgetter('name'))
+    if not cols:
         log.cli_output(messages['LIST_COLS']['OUTPUT']['NOT_AVAILABLE'])
     else:
         log.cli_output("{}{}".format(messages['LIST_COLS']['OUTPUT']['COUNT'], len(cols)))
-        for col in sorted(cols.values(), key=lambda c: c.name):
+        for col in cols:
             log.cli_output('{}"{}"\t{}"{}"'.format(
                 messages['LIST_COLS']['OUTPUT']['COL_NAME'], col.name,
                 messages['LIST_COLS']['OUTPUT']['COL_ROOT'], col.base
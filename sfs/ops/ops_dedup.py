@@ -148,6 +148,7 @@ def _dedup_command_handler(args):
 
 
 class DuplicateLink:
+    __slots__ = ('sfs_path', 'source_path', 'size', 'ctime', 'keep')
 
     def __init__(self, sfs_path, source_path=None, size=None, ctime=None, keep=1):
         self.sfs_path = sfs_path
@@ -178,9 +179,9 @@ def find_dups(sfs, target_dir, keep='all'):
     :return: List of duplicate lists where each item is an instance of DuplicateLink
     """
     # dups keeps track of only duplicate keys
-    dups = collections.defaultdict(set)
-    # node_dict keeps track metadata of all nodes
-    node_dict = collections.defaultdict(lambda: collections.defaultdict(list))
+    dups = set()
+    # node_dict keeps track metadata of all nodes keyed by source file name and size
+    node_dict = collections.defaultdict(list)
 
     for root, files, dirs, links in core.SFS.walk(fs.walk_bfs, target_dir):
         for lnk in links:
@@ -195,13 +196,13 @@ def find_dups(sfs, target_dir, keep='all'):
                 continue
 
             # Dictionary keys are source file and size
-            name = os.path.basename(source_path)
-            dup_list = node_dict[name][stats.size]
-            dup_list.append([lnk, source_path, stats])
+            key = (os.path.basename(source_path), stats.size)
+            dup_list = node_dict[key]
+            dup_list.append((lnk, source_path, stats))
 
             # Add only duplicate keys to dups
             if len(dup_list) > 1:
-                dups[name].add(stats.size)
+                dups.add(key)
 
     # Compute a list lists of DuplicateLink
     return [
@@ -210,9 +211,9 @@ def find_dups(sfs, target_dir, keep='all'):
                 os.path.relpath(lnk.path, target_dir), source_path=source_path,
                 size=stats.size, ctime=stats.ctime,
                 keep=0 if (keep == 'first' and i > 0) else 1
-            ) for i, (lnk, source_path, stats) in enumerate(node_dict[name][size])
+            ) for i, (lnk, source_path, stats) in enumerate(node_dict[key])
         ]
-        for name in sorted(dups) for size in sorted(dups[name])
+        for key in sorted(dups)
     ]
 
 
@@ -1,6 +1,8 @@
 """CLI for merging directories in an SFS"""
 
 import collections
+import errno
+import functools
 import itertools
 import os
 import shutil
@@ -156,7 +158,10 @@ def _merge_command_handler(args):
         log.cli_output("{}{}".format(messages['MERGE']['OUTPUT']['CONFLICT_COUNT'], len(conflicts)))
         log.cli_output("{}{}".format(messages['MERGE']['OUTPUT']['JSON_PATH'], json_path))
     else:
-        merge_stats = merge(target, source, conflicts)
+        # Source nodes are counted before the merge as they are moved out of the source directory if it is to be deleted
+        # If such a merge fails midway, the source is left partially moved into the target and is not deleted
+        source_count = fs.count_nodes(source) if args.del_source else None
+        merge_stats = merge(target, source, conflicts, move=args.del_source)
         log.cli_output("{}{}".format(messages['MERGE']['OUTPUT']['CONFLICT_COUNT'], len(conflicts)))
         for prop in ['DIRS_CREATED', 'DIRS_DELETED', 'FILES_MERGED', 'LINKS_MERGED', 'NODES_DELETED', 'NODES_RENAMED']:
             log.cli_output("{}{}".format(messages['MERGE']['OUTPUT'][prop], merge_stats[prop]))
@@ -164,7 +169,6 @@ def _merge_command_handler(args):
         if args.del_json and os.path.isfile(json_path):
             os.unlink(json_path)
         if args.del_source:
-            source_count = fs.count_nodes(source)
             shutil.rmtree(source)
             log.cli_output("{}{}".format(
                 messages['MERGE']['OUTPUT']['SOURCE_DELETED'], source_count['links'] + source_count['files']
@@ -173,6 +177,7 @@ def _merge_command_handler(args):
 
 class MergeConflict:
     class FileStats:
+        __slots__ = ('name', 'size', 'ctime', 'is_link', 'is_dir', 'source_path', 'source_size', 'source_ctime', 'keep')
 
         def __init__(self, name, size=None, ctime=None, is_link=True, is_dir=False, source_path=None, source_size=None,
                      source_ctime=None, keep=True):
@@ -186,6 +191,8 @@ class MergeConflict:
             self.source_ctime = source_ctime
             self.keep = keep
 
+    __slots__ = ('path', 'target', 'source')
+
     def __init__(self, path, target, source):
         self.path = path
         self.target = target
@@ -210,41 +217,42 @@ class MergeConflict:
 
     @staticmethod
     def from_dict(json_dict):
-        log.logger.debug(json_dict)
         target = MergeConflict.FileStats(json_dict['Target']['Name'], keep=json_dict['Target']['Keep'] != 0)
         source = MergeConflict.FileStats(json_dict['Source']['Name'], keep=json_dict['Source']['Keep'] != 0)
         return MergeConflict(json_dict['Path'], target, source)
 
 
-def _generate_merge_paths(target, source, base_path=None):
+def _generate_merge_paths(target, source, rel_path=os.curdir):
     """Recursively enumerates all common directories in the sub-tree of target and source
     The enumerated directories are the ones with potential merge conflicts
     """
 
-    base_path = target if base_path is None else base_path
     target_nodes = fs.separate_nodes(fs.scan_dir(target))
     source_nodes = fs.separate_nodes(fs.scan_dir(source))
-    yield os.path.relpath(target, base_path), target_nodes, source_nodes
+    yield rel_path, target_nodes, source_nodes
     target_dirs = {node.name: node for node in target_nodes.dirs}
     for node in source_nodes.dirs:
         if node.name in target_dirs:
-            yield from _generate_merge_paths(target_dirs[node.name].path, node.path, base_path=base_path)
+            # Relative paths are extended with each level instead of being recomputed from the base path
+            child_rel_path = node.name if rel_path == os.curdir else os.path.join(rel_path, node.name)
+            yield from _generate_merge_paths(target_dirs[node.name].path, node.path, rel_path=child_rel_path)
 
 
-def get_renamed_filename(name):
-    """Rename a file uniquely for merging"""
-    return "{}.merged.{}".format(name, round(time.time()))
+def get_renamed_filename(name, timestamp=None):
+    """Rename a file uniquely for merging, using the current time if 'timestamp' is None"""
+    return "{}.merged.{}".format(name, round(time.time()) if timestamp is None else timestamp)
 
 
 def validate_merge_conflicts(target, source, conflicts):
     """Check if the specified conflicts resolution resloves all merge conflicts in the source and target directories"""
     conflicts_dict = {fs.expand_path(os.path.join(target, c.path)): c for c in conflicts}
     for rel_path, target_nodes, source_nodes in _generate_merge_paths(target, source):
+        target_dir = fs.expand_path(os.path.join(target, rel_path))
         nodes_dict = {}
         for i, nodes in enumerate([target_nodes, source_nodes]):
             is_target = i == 0
             for node in itertools.chain(*nodes):
-                node_target = fs.expand_path(os.path.join(target, rel_path, node.name))
+                node_target = os.path.join(target_dir, node.name)
                 if node_target in conflicts_dict:
                     node_stats = getattr(conflicts_dict[node_target], 'target' if is_target else 'source')
                     if not node_stats.keep:
@@ -267,6 +275,8 @@ def get_merge_conflicts(sfs, target, source, keep=constants['MERGE_MODES']['KEEP
     """Compute the merge conflicts in target and source directory using conflict resolution specified through 'keep'"""
 
     conflicts = []
+    # All source files of a merge are renamed with the same timestamp
+    merge_time = round(time.time())
     for path, target_nodes, source_nodes in _generate_merge_paths(target, source):
         target_nodes_dict = {node.name: node for node in itertools.chain(*target_nodes)}
         for source_node in itertools.chain(*source_nodes):
@@ -276,7 +286,7 @@ def get_merge_conflicts(sfs, target, source, keep=constants['MERGE_MODES']['KEEP
             node_stats = []
             for i, curr_node in enumerate([target_nodes_dict[source_node.name], source_node]):
                 is_source = i == 1
-                name = get_renamed_filename(curr_node.name) if is_source else curr_node.name
+                name = get_renamed_filename(curr_node.name, merge_time) if is_source else curr_node.name
                 source_path = source_stats = None
                 if curr_node.is_symlink:
                     source_path = os.readlink(curr_node.path)
@@ -301,19 +311,23 @@ def get_merge_conflicts(sfs, target, source, keep=constants['MERGE_MODES']['KEEP
     return conflicts
 
 
-def merge(target, source, conflicts):
-    """Merge source directory into target directory handling conflicts as specified in 'conflicts'"""
+def merge(target, source, conflicts, move=False):
+    """Merge source directory into target directory handling conflicts as specified in 'conflicts'
+    If 'move' is True, source nodes are moved into the target directory instead of being copied, leaving behind only
+    the nodes that are not merged
+    """
 
     conflicts_dict = {fs.expand_path(os.path.join(target, c.path)): c for c in conflicts}
     merge_stats = collections.defaultdict(int)
 
     for rel_path, target_nodes, source_nodes in _generate_merge_paths(target, source):
+        target_dir = fs.expand_path(os.path.join(target, rel_path))
 
         # Map of target node names to target nodes
         target_nodes_dict = {node.name: node for node in itertools.chain(*target_nodes)}
 
         for source_node in itertools.chain(*source_nodes):
-            target_node_path = fs.expand_path(os.path.join(target, rel_path, source_node.name))
+            target_node_path = os.path.join(target_dir, source_node.name)
             conflict = conflicts_dict[target_node_path] if target_node_path in conflicts_dict else None
 
             # Resolve target conflicts
@@ -329,7 +343,7 @@ def merge(target, source, conflicts):
                         os.unlink(target_node.path)
                         merge_stats['NODES_DELETED'] += 1
                 if target_node.name != conflict.target.name:
-                    rename_path = os.path.join(target, rel_path, conflict.target.name)
+                    rename_path = os.path.join(target_dir, conflict.target.name)
                     os.rename(target_node.path, rename_path)
                     merge_stats['NODES_RENAMED'] += 1
 
@@ -337,12 +351,12 @@ def merge(target, source, conflicts):
             if conflict and not conflict.source.keep:
                 continue
             source_name = source_node.name if conflict is None else conflict.source.name
-            merge_path = os.path.join(target, rel_path, source_name)
+            merge_path = os.path.join(target_dir, source_name)
             if source_node.is_symlink:
-                fs.copy_symlink(source_node.path, merge_path)
+                _merge_node(source_node.path, merge_path, fs.copy_symlink, move)
                 merge_stats['LINKS_MERGED'] += 1
             elif source_node.is_file:
-                shutil.copy2(source_node.path, merge_path)
+                _merge_node(source_node.path, merge_path, shutil.copy2, move)
                 merge_stats['FILES_MERGED'] += 1
             else:
                 if not os.path.isdir(merge_path):
@@ -350,10 +364,26 @@ def merge(target, source, conflicts):
                     merge_stats['LINKS_MERGED'] += counts['links']
                     merge_stats['FILES_MERGED'] += counts['files']
                     merge_stats['DIRS_CREATED'] += 1 + counts['dirs']
-                    shutil.copytree(source_node.path, merge_path, symlinks=True)
+                    _merge_node(
+                        source_node.path, merge_path, functools.partial(shutil.copytree, symlinks=True), move
+                    )
     return merge_stats
 
 
+def _merge_node(source_path, merge_path, copy_func, move):
+    """Move a node with a rename if 'move' is True, else copy it using 'copy_func'
+    Copying is the fallback when a rename is not possible across file systems
+    """
+    if move:
+        try:
+            os.rename(source_path, merge_path)
+            return
+        except OSError as exc:
+            if exc.errno != errno.EXDEV:
+                raise
+    copy_func(source_path, merge_path)
+
+
 def get_json_path(target_dir):
     """Compute path of merge conflicts JSON in the target directory"""
     return os.path.join(
@@ -182,6 +182,9 @@ class TestDedupMerge(test_helper.TestCaseWithFS):
         self.assertIsNone(file_stats.source_size)
         self.assertIsNone(file_stats.source_ctime)
 
+        # Renames all source files with the same timestamp
+        self.assertEqual(1, len({con.source.name.rsplit('.', 1)[1] for con in conflicts}))
+
         # Computes directory stats correctly
         dir_stats = conflict_dict[fs.expand_path(os.path.join(target, 'file_or_dir'))].target
         self.assertEqual(dir_stats.name, 'file_or_dir')
@@ -247,3 +250,53 @@ class TestDedupMerge(test_helper.TestCaseWithFS):
             'links': 10,
             'dirs': 2
         }, fs.count_nodes(target))
+
+    def test_merge_move(self):
+        self.create_fs_tree({
+            'dirs': {
+                'target': {
+                    'files': ['file_1'],
+                    'dirs': {
+                        'dir_1': {
+                            'files': ['file_2'],
+                        }
+                    }
+                },
+                'source': {
+                    'files': ['file_s'],
+                    'links': ['link_s'],
+                    'dirs': {
+                        'dir_1': {
+                            'files': ['file_s2'],
+                        },
+                        'dir_s': {
+                            'files': ['file_s1'],
+                            'links': ['link_s1']
+                        }
+                    }
+                }
+            }
+        })
+        target = os.path.join(self.TESTS_BASE, 'target')
+        source = os.path.join(self.TESTS_BASE, 'source')
+
+        # Moves source nodes into target and returns the same stats as a copy
+        merge_stats = ops_merge.merge(target, source, [], move=True)
+        self.assertEqual({
+            'DIRS_CREATED': 1,
+            'FILES_MERGED': 3,
+            'LINKS_MERGED': 2,
+        }, merge_stats)
+        self.assertEqual({
+            'files': 5,
+            'links': 2,
+            'dirs': 2
+        }, fs.count_nodes(target))
+        self.assertTrue(os.path.islink(os.path.join(target, 'dir_s', 'link_s1')))
+
+        # Only common directories are left behind in source
+        self.assertEqual({
+            'files': 0,
+            'links': 0,
+            'dirs': 1
+        }, fs.count_nodes(source))
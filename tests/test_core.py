@@ -2,6 +2,7 @@ import datetime
 import os
 import shutil
 import time
+import unittest.mock
 
 import sfs.core as core
 import sfs.file_system as fs
@@ -236,6 +237,14 @@ class CollectionTests(helper.TestCaseWithFS):
         col11 = self.sfs.get_collection_by_path(os.path.join(self.TESTS_BASE, 'col11'))
         self.assertIsNone(col11)
 
+        # Reflects collections added or deleted after a lookup
+        self.sfs.del_collection('col1')
+        self.assertIsNone(self.sfs.get_collection_by_path(self.col1_base))
+        col3_base = os.path.join(self.TESTS_BASE, 'col3')
+        os.mkdir(col3_base)
+        self.sfs.add_collection('col3', col3_base)
+        self.assertEqual('col3', self.sfs.get_collection_by_path(col3_base).name)
+
     def test_get_all_collections(self):
         self.sfs.add_collection('col1', self.col1_base)
         self.sfs.add_collection('col2', self.col2_base)
@@ -323,6 +332,24 @@ class CollectionTests(helper.TestCaseWithFS):
         self.assertEqual(0, fs.count_nodes(os.path.join(self.sfs.root, col1.name))['links'])
         self.assertEqual(1, fs.count_nodes(self.sfs.root)['links'])
 
+    def test_delete_orphans_col_non_normalized_links(self):
+        self.sfs.add_collection('col1', self.col1_base)
+        col1 = self.sfs.get_collection_by_name('col1')
+
+        # Foreign link whose source resolves outside the collection root
+        foreign_link = os.path.join(self.sfs.root, 'foreign_link')
+        os.symlink(os.path.join(col1.base, os.pardir, 'other', 'g'), foreign_link)
+
+        # Orphan link whose source is within the collection root but is not normalized
+        orphan_link = os.path.join(self.sfs.root, 'orphan_link')
+        os.symlink(os.path.dirname(col1.base) + '//' + os.path.basename(col1.base) + '/missing', orphan_link)
+
+        # Link sources are normalized before being checked against the collection root
+        sfs_updates = self.sfs.del_orphans(col_root=col1.base)
+        self.assertEqual(1, sfs_updates.deleted)
+        self.assertTrue(os.path.islink(foreign_link))
+        self.assertFalse(os.path.lexists(orphan_link))
+
     def test_delete_orphans_all(self):
         self.sfs.add_collection('col1', self.col1_base)
         self.sfs.add_collection('col2', self.col2_base)
@@ -401,6 +428,62 @@ class CollectionTests(helper.TestCaseWithFS):
         self.assertEqual(3, deletions.deleted)
         self.assertEqual(0, deletions.updated)
 
+    def test_update_collection_in_place(self):
+        helper.dummy_file(os.path.join(self.col1_base, 'file_1c'))
+        self.sfs.add_collection('col1', self.col1_base)
+        col = self.sfs.get_collection_by_name('col1')
+
+        # A file which does not change
+        col_path_unchanged = os.path.join(self.col1_base, 'file_1b')
+
+        # Changing the size of a file
+        col_path_changed = os.path.join(self.col1_base, 'dir_1a', 'file_1aa')
+        helper.dummy_file(col_path_changed, 50)
+
+        # Truncating metadata of a file as by an interrupted write
+        col_path_truncated = os.path.join(self.col1_base, 'link_1a')
+        stats_path_truncated = os.path.join(col.stats_base, 'link_1a')
+        open(stats_path_truncated, 'w').close()
+
+        # Corrupting the frame length of pickled metadata of a file
+        col_path_corrupt = os.path.join(self.col1_base, 'file_1c')
+        stats_path_corrupt = os.path.join(col.stats_base, 'file_1c')
+        with open(stats_path_corrupt, 'rb') as pfile:
+            corrupt = bytearray(pfile.read())
+        corrupt[10] = 0xb8
+        with open(stats_path_corrupt, 'wb') as pfile:
+            pfile.write(corrupt)
+
+        # Deleting a file and a directory
+        col_path_deleted = os.path.join(self.col1_base, 'file_1a')
+        col_dir_deleted = os.path.join(self.col1_base, 'dir_1a', 'dir_1aa')
+        os.unlink(col_path_deleted)
+        shutil.rmtree(col_dir_deleted)
+
+        with unittest.mock.patch('sfs.file_system.save_pickled', wraps=fs.save_pickled) as save_pickled:
+            sfs_updates = col.update()
+        self.assertEqual(4, sfs_updates.updated)
+
+        # Metadata is rewritten only for changed files and unreadable metadata
+        self.assertEqual(
+            sorted([col_path_changed, col_path_truncated, col_path_corrupt]),
+            sorted(os.path.join(self.col1_base, os.path.relpath(args[1], col.stats_base))
+                   for args, kwargs in save_pickled.call_args_list)
+        )
+        self.assertIsNotNone(col.get_stats(col_path_unchanged))
+
+        # Metadata of changed files is rewritten
+        self.assertEqual(50, col.get_stats(col_path_changed).size)
+
+        # Unreadable metadata is rewritten
+        truncated_size = os.stat(col_path_truncated, follow_symlinks=False).st_size
+        self.assertEqual(truncated_size, col.get_stats(col_path_truncated).size)
+        self.assertEqual(os.stat(col_path_corrupt).st_size, col.get_stats(col_path_corrupt).size)
+
+        # Stale metadata of deleted files and directories is deleted
+        self.assertIsNone(col.get_stats(col_path_deleted))
+        self.assertFalse(os.path.exists(os.path.join(col.stats_base, 'dir_1a', 'dir_1aa')))
+
     def test_get_stats(self):
         # Adding a file to a collection and recording the time before and after
         before = datetime.datetime.now()
@@ -1,5 +1,7 @@
 import os
 import json
+import pickle
+import pickletools
 import unittest
 
 import sfs.file_system as fs
@@ -342,6 +344,11 @@ class PickleUtilsTests(helper.TestCaseWithFS):
         fs.save_pickled(test_dict, self.TESTS_BASE, file_name)
         self.assertTrue(os.path.isfile(os.path.join(self.TESTS_BASE, file_name)))
 
+        # Uses the highest pickle protocol
+        with open(os.path.join(self.TESTS_BASE, file_name), 'rb') as pfile:
+            protocol = next(pickletools.genops(pfile))[1]
+        self.assertEqual(pickle.HIGHEST_PROTOCOL, protocol)
+
     def test_load_unpickled(self):
         test_dict = {
             'a': 1,
@@ -354,6 +361,38 @@ class PickleUtilsTests(helper.TestCaseWithFS):
         unpickled = fs.load_unpickled(self.TESTS_BASE, file_name)
         self.assertEqual(test_dict, unpickled)
 
+    def test_pickle_node_stats(self):
+        stats = fs.FSNode.NodeStats(ctime=1.5, size=10, dest='dest')
+        file_name = 'pickle_test'
+        fs.save_pickled(stats, self.TESTS_BASE, file_name)
+
+        # Un-pickles node stats with the same attributes
+        self.assertEqual(stats, fs.load_unpickled(self.TESTS_BASE, file_name))
+
+        # Restores node stats pickled as a dictionary of attributes by older versions (protocol 3)
+        legacy_pickle = (
+            b'\x80\x03cbuiltins\ngetattr\nq\x00csfs.file_system\nFSNode\nq\x01X\t\x00\x00\x00NodeStatsq\x02\x86q\x03Rq'
+            b'\x04)\x81q\x05}q\x06(X\x05\x00\x00\x00ctimeq\x07G?\xf8\x00\x00\x00\x00\x00\x00'
+            b'X\x04\x00\x00\x00sizeq\x08K\nX\x04\x00\x00\x00destq\th\tub.'
+        )
+        legacy_file_name = 'legacy_pickle_test'
+        with open(os.path.join(self.TESTS_BASE, legacy_file_name), 'wb') as pfile:
+            pfile.write(legacy_pickle)
+        legacy_stats = fs.load_unpickled(self.TESTS_BASE, legacy_file_name)
+        self.assertIsInstance(legacy_stats, fs.FSNode.NodeStats)
+        self.assertEqual(stats, legacy_stats)
+
+    def test_node_stats_equality(self):
+        stats = fs.FSNode.NodeStats(ctime=1.5, size=10, dest='dest')
+
+        # Node stats are equal when all attributes are equal
+        self.assertEqual(stats, fs.FSNode.NodeStats(ctime=1.5, size=10, dest='dest'))
+        self.assertNotEqual(stats, fs.FSNode.NodeStats(ctime=1.5, size=20, dest='dest'))
+        self.assertNotEqual(stats, (1.5, 10, 'dest'))
+
+        # Equal node stats hash alike
+        self.assertEqual(1, len({stats, fs.FSNode.NodeStats(ctime=1.5, size=10, dest='dest')}))
+
 
 class JSONUtilTests(helper.TestCaseWithFS):
 
@@ -0,0 +1,80 @@
+import io
+import logging
+import unittest
+import unittest.mock
+
+import sfs.log_utils as log
+
+
+class BufferedStreamHandlerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.handler = log.BufferedStreamHandler(stream=self.stream, capacity=3, flush_level=logging.ERROR)
+        self.handler.setFormatter(logging.Formatter('%(message)s'))
+        self.logger = logging.getLogger('sfs-test-buffered')
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.addHandler(self.handler)
+
+    def tearDown(self):
+        self.logger.removeHandler(self.handler)
+
+    def test_buffers_until_flushed(self):
+        self.logger.info('msg1')
+        self.logger.info('msg2')
+
+        # Nothing is written before a flush
+        self.assertEqual('', self.stream.getvalue())
+
+        # Flushing writes out all buffered records
+        self.handler.flush()
+        self.assertEqual('msg1\nmsg2\n', self.stream.getvalue())
+
+        # Buffer is emptied after a flush
+        self.handler.flush()
+        self.assertEqual('msg1\nmsg2\n', self.stream.getvalue())
+
+    def test_flushes_at_capacity(self):
+        self.logger.info('msg1')
+        self.logger.info('msg2')
+        self.assertEqual('', self.stream.getvalue())
+
+        # Records are written out once the capacity is reached
+        self.logger.info('msg3')
+        self.assertEqual('msg1\nmsg2\nmsg3\n', self.stream.getvalue())
+
+    def test_flushes_at_flush_level(self):
+        self.logger.info('msg1')
+        self.logger.warning('msg2')
+        self.assertEqual('', self.stream.getvalue())
+
+        # A record at or above the flush level flushes the buffer immediately
+        self.logger.error('msg3')
+        self.assertEqual('msg1\nmsg2\nmsg3\n', self.stream.getvalue())
+
+    def test_raises_recursion_error(self):
+        def _format(record):
+            raise RecursionError()
+
+        self.handler.format = _format
+        with self.assertRaises(RecursionError):
+            self.logger.info('msg1')
+
+    def test_handles_stream_write_errors(self):
+        def _write(data):
+            raise OSError('test error')
+
+        self.stream.write = _write
+        with unittest.mock.patch.object(self.handler, 'handleError') as handle_error:
+            # Write errors are reported with handleError instead of being raised
+            self.logger.info('msg1')
+            self.logger.error('msg2')
+            self.assertEqual(1, handle_error.call_count)
+            self.assertEqual('msg2', handle_error.call_args[0][0].getMessage())
+
+            # Buffered records are discarded after a failed write
+            self.logger.info('msg3')
+            self.handler.flush()
+            self.assertEqual(2, handle_error.call_count)
+            self.assertEqual([], self.handler.buffer)
@@ -104,7 +104,10 @@ class FileSizeHelperTests(unittest.TestCase):
 
     def test_get_readable_size(self):
         tests = [
+            (0, '0.00 Bytes'),
             (10, '10.00 Bytes'),
+            (1023, '1023.00 Bytes'),
+            (1024, '1.00 kB'),
             (10 * 1024, '10.00 kB'),
             (10 * (1024 ** 2), '10.00 MB'),
             (10 * (1024 ** 3), '10.00 GB'),
@@ -1,11 +1,13 @@
 import argparse
 import contextlib
+import io
 import os
 import time
 import unittest
 import unittest.mock
 
 import sfs.cli as cli
+import sfs.config as config
 import sfs.core as core
 import sfs.events as events
 import sfs.exceptions as exceptions
@@ -99,6 +101,33 @@ class CLIManagerTests(unittest.TestCase):
                 raise Exception(exception_message)
             self.assertEqual(prepare_args(cli.error_messages['UNKNOWN']), cli_output.call_args)
 
+    def test_cli_manager_flushes_output(self):
+        test_cmd = [ops_main.commands['SFS_INIT']]
+        log.cli_handler.flush()
+        stream = io.StringIO()
+        with unittest.mock.patch.object(log.cli_handler, 'stream', stream):
+            with cli.cli_manager(test_cmd, exit_on_error=False):
+                log.cli_output('test message')
+                # Output is buffered while the command executes
+                self.assertEqual('', stream.getvalue())
+            # Buffered output is written when the command completes
+            self.assertEqual('{}test message\n'.format(config.CLI_OUTPUT_PREFIX), stream.getvalue())
+
+    def test_cli_manager_flushes_output_on_error(self):
+        test_cmd = [ops_main.commands['SFS_INIT']]
+        exception_message = 'test message'
+        log.cli_handler.flush()
+        stream = io.StringIO()
+        with unittest.mock.patch.object(log.cli_handler, 'stream', stream):
+            with self.assertRaises(exceptions.CLIValidationException):
+                with cli.cli_manager(test_cmd, exit_on_error=False, raise_error=True):
+                    log.cli_output('test output')
+                    raise exceptions.CLIValidationException(exception_message)
+            # Buffered output and the error are written before the error is raised
+            self.assertEqual('{0}test output\n{0}{1}\n'.format(
+                config.CLI_OUTPUT_PREFIX, prepare_validation_error(exception_message)
+            ), stream.getvalue())
+
 
 class MainOpsCLITests(test_helper.TestCaseWithFS):
 